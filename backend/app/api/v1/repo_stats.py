@@ -1,177 +1,152 @@
 """
 Repository stats endpoint for analyzing GitHub repositories.
 """
+import asyncio
 import logging
 import re
-from typing import Any, Dict, List, Optional
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+import orjson
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Request, Response
+from redis import asyncio as aioredis
+from app.core.config import settings
+from app.models.repo_stats import RepoStatsRequest, RepoStatsResponse
 from app.services.github.repo_stats import GitHubRepoStatsService
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Serialized responses are cached briefly per repo; metrics rarely change
+# minute-to-minute and a warm read skips the whole GitHub fan-out
+_CACHE_TTL = 300
+_redis: Optional[aioredis.Redis] = None
 
-class RepoStatsRequest(BaseModel):
-    repo_url: str
-
-
-class AuthorInfo(BaseModel):
-    login: str | None = None
-    avatar_url: str | None = None
-    profile_url: str | None = None
-
-
-class ContributorInfo(BaseModel):
-    login: str | None = None
-    avatar_url: str | None = None
-    profile_url: str | None = None
-    contributions: int = 0
-    type: str = "User"
-
-
-class PullRequestDetail(BaseModel):
-    number: int
-    title: str
-    state: str
-    url: str
-    created_at: str | None = None
-    updated_at: str | None = None
-    author: AuthorInfo
-    labels: List[str] = []
-    comments: int = 0
-    draft: bool = False
-
-
-class PullRequestStats(BaseModel):
-    open: int = 0
-    closed: int = 0
-    merged: int = 0
-    total: int = 0
-    details: List[PullRequestDetail] = []
-
-
-class IssueDetail(BaseModel):
-    number: int
-    title: str
-    state: str
-    url: str
-    created_at: str | None = None
-    author: AuthorInfo
-    labels: List[str] = []
-    comments: int = 0
-
-
-class IssueStats(BaseModel):
-    open: int = 0
-    closed: int = 0
-    total: int = 0
-    details: List[IssueDetail] = []
-
-
-class CommitActivity(BaseModel):
-    week: str
-    total: int = 0
-    days: List[int] = []
-
-
-class ReleaseInfo(BaseModel):
-    tag_name: str
-    name: str | None = None
-    published_at: str | None = None
-    url: str | None = None
-    prerelease: bool = False
-
-
-class RepositoryInfo(BaseModel):
-    name: str
-    full_name: str
-    description: str | None = None
-    url: str
-    stars: int = 0
-    forks: int = 0
-    watchers: int = 0
-    open_issues_count: int = 0
-    default_branch: str | None = None
-    created_at: str | None = None
-    updated_at: str | None = None
-    pushed_at: str | None = None
-    topics: List[str] = []
-    license: str | None = None
-
-
-class Metrics(BaseModel):
-    total_contributors: int = 0
-    total_commits_recent: int = 0
-    stars: int = 0
-    forks: int = 0
-    open_prs: int = 0
-    open_issues: int = 0
-
-
-class RepoStatsResponse(BaseModel):
-    status: str
-    repo: str | None = None
-    message: str | None = None
-    repository: RepositoryInfo | None = None
-    contributors: List[ContributorInfo] = []
-    pull_requests: PullRequestStats | None = None
-    issues: IssueStats | None = None
-    commit_activity: List[CommitActivity] = []
-    languages: Dict[str, int] = {}
-    releases: List[ReleaseInfo] = []
-    metrics: Metrics | None = None
+
+def _get_redis() -> Optional[aioredis.Redis]:
+    """Lazily create the Redis client; caching is skipped when unconfigured"""
+    global _redis
+    if _redis is None and settings.redis_url:
+        _redis = aioredis.from_url(settings.redis_url)
+    return _redis
+
+
+def _serialize_result(result: dict) -> bytes:
+    """Encode the stats result (dicts plus constructed models) to JSON bytes"""
+    return orjson.dumps(result, default=lambda o: o.model_dump())
+
+
+# Single-flight: concurrent requests for the same repo share one fetch.
+# The first caller does the work; the rest await its future.
+_inflight: dict[tuple[str, str], asyncio.Future] = {}
+
+
+async def _fetch_and_serialize(owner: str, repo: str, session, redis_client) -> bytes:
+    """Fetch stats for a repo once, no matter how many callers are waiting"""
+    key = (owner, repo)
+    existing = _inflight.get(key)
+    if existing is not None:
+        logger.info(f"Joining in-flight stats fetch for {owner}/{repo}")
+        return await existing
+
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    _inflight[key] = future
+    try:
+        stats_service = GitHubRepoStatsService(session)
+        result = await stats_service.get_comprehensive_stats(owner, repo)
+
+        # Encode in a worker thread so a large payload (contributors plus
+        # PR/issue details) doesn't block the event loop under load
+        body = await loop.run_in_executor(None, _serialize_result, result)
+    except BaseException as e:
+        future.set_exception(e)
+        # Mark the exception retrieved in case no one else is waiting;
+        # awaiting followers still have it re-raised
+        future.exception()
+        raise
+    else:
+        future.set_result(body)
+    finally:
+        del _inflight[key]
+
+    if redis_client:
+        try:
+            await redis_client.set(f"repo_stats:{owner}/{repo}", body, ex=_CACHE_TTL)
+        except Exception as e:
+            logger.warning(f"Redis cache write failed: {e}")
+
+    return body
+
+# Compiled once at import; parse_repo_url sits on the request hot path
+_URL_RE = re.compile(r'github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?$')
+_SHORT_RE = re.compile(r'^([a-zA-Z0-9][-a-zA-Z0-9]*)/([a-zA-Z0-9._-]+)$')
 
 
 def parse_repo_url(repo_input: str) -> tuple[str, str]:
     """Parse repository URL or owner/repo format"""
-    repo_input = repo_input.strip().rstrip('/').rstrip('.git')
-
-    patterns = [
-        (r'github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?$', 'url'),
-        (r'^([a-zA-Z0-9][-a-zA-Z0-9]*)/([a-zA-Z0-9._-]+)$', 'short')
-    ]
+    repo_input = repo_input.strip().rstrip('/').removesuffix('.git')
 
-    for pattern, _ in patterns:
-        match = re.search(pattern, repo_input)
+    # Cheap 'owner/repo' short form first; only URLs contain a scheme
+    if '://' not in repo_input:
+        match = _SHORT_RE.match(repo_input)
         if match:
             owner, repo = match.groups()
             return owner, repo
 
+    match = _URL_RE.search(repo_input)
+    if match:
+        owner, repo = match.groups()
+        return owner, repo
+
     raise ValueError(
         f"Invalid repository format: '{repo_input}'. "
         "Expected: 'owner/repo' or 'https://github.com/owner/repo'"
     )
 
 
-@router.post("/repo-stats", response_model=RepoStatsResponse)
-async def analyze_repository(request: RepoStatsRequest):
+# The handler returns pre-serialized bytes, so the schema is attached for
+# documentation only instead of via response_model (which would re-validate)
+@router.post("/repo-stats", responses={200: {"model": RepoStatsResponse}})
+async def analyze_repository(request: RepoStatsRequest, http_request: Request, refresh: bool = False):
     """
     Analyze a GitHub repository and return comprehensive stats.
-    
+
     Returns contributors, pull requests, issues, commit activity,
-    languages, and other repository metrics.
+    languages, and other repository metrics. Responses are cached in
+    Redis for a few minutes; pass ?refresh=true to bypass the cache.
     """
     try:
         logger.info(f"Received repo-stats request for: {request.repo_url}")
-        
+
         # Parse the repository URL
         try:
             owner, repo = parse_repo_url(request.repo_url)
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
-        
+
+        cache_key = f"repo_stats:{owner}/{repo}"
+        redis_client = _get_redis()
+
+        if redis_client and not refresh:
+            try:
+                cached = await redis_client.get(cache_key)
+            except Exception as e:
+                logger.warning(f"Redis cache read failed: {e}")
+                cached = None
+            if cached:
+                logger.info(f"Serving cached stats for {owner}/{repo}")
+                return Response(content=cached, media_type="application/json")
+
         logger.info(f"Fetching stats for {owner}/{repo}")
-        
-        # Fetch comprehensive stats from GitHub
-        async with GitHubRepoStatsService() as stats_service:
-            result = await stats_service.get_comprehensive_stats(owner, repo)
-        
+
+        # Fetch comprehensive stats from GitHub over the shared session;
+        # concurrent callers for the same repo coalesce into one fetch
+        body = await _fetch_and_serialize(owner, repo, http_request.app.state.http, redis_client)
+
         logger.info(f"Successfully fetched stats for {owner}/{repo}")
-        
-        return result
-        
+
+        return Response(content=body, media_type="application/json")
+
     except HTTPException:
         raise
     except ValueError as e:
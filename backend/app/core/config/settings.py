@@ -36,6 +36,9 @@ class Settings(BaseSettings):
     # RabbitMQ configuration
     rabbitmq_url: Optional[str] = None
 
+    # Redis configuration (optional - repo stats response cache)
+    redis_url: Optional[str] = None
+
     # Backend URL
     backend_url: str = ""
 
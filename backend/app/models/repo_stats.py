@@ -0,0 +1,116 @@
+from pydantic import BaseModel
+from typing import Dict, List
+
+
+# Request Models
+class RepoStatsRequest(BaseModel):
+    """Request model for analyzing a repository."""
+    repo_url: str
+
+
+# Response Models
+class AuthorInfo(BaseModel):
+    login: str | None = None
+    avatar_url: str | None = None
+    profile_url: str | None = None
+
+
+class ContributorInfo(BaseModel):
+    login: str | None = None
+    avatar_url: str | None = None
+    profile_url: str | None = None
+    contributions: int = 0
+    type: str = "User"
+
+
+class PullRequestDetail(BaseModel):
+    number: int
+    title: str
+    state: str
+    url: str
+    created_at: str | None = None
+    updated_at: str | None = None
+    author: AuthorInfo
+    labels: List[str] = []
+    comments: int = 0
+    draft: bool = False
+
+
+class PullRequestStats(BaseModel):
+    open: int = 0
+    closed: int = 0
+    merged: int = 0
+    total: int = 0
+    details: List[PullRequestDetail] = []
+
+
+class IssueDetail(BaseModel):
+    number: int
+    title: str
+    state: str
+    url: str
+    created_at: str | None = None
+    author: AuthorInfo
+    labels: List[str] = []
+    comments: int = 0
+
+
+class IssueStats(BaseModel):
+    open: int = 0
+    closed: int = 0
+    total: int = 0
+    details: List[IssueDetail] = []
+
+
+class CommitActivity(BaseModel):
+    week: str
+    total: int = 0
+    days: List[int] = []
+
+
+class ReleaseInfo(BaseModel):
+    tag_name: str
+    name: str | None = None
+    published_at: str | None = None
+    url: str | None = None
+    prerelease: bool = False
+
+
+class RepositoryInfo(BaseModel):
+    name: str
+    full_name: str
+    description: str | None = None
+    url: str
+    stars: int = 0
+    forks: int = 0
+    watchers: int = 0
+    open_issues_count: int = 0
+    default_branch: str | None = None
+    created_at: str | None = None
+    updated_at: str | None = None
+    pushed_at: str | None = None
+    topics: List[str] = []
+    license: str | None = None
+
+
+class Metrics(BaseModel):
+    total_contributors: int = 0
+    total_commits_recent: int = 0
+    stars: int = 0
+    forks: int = 0
+    open_prs: int = 0
+    open_issues: int = 0
+
+
+class RepoStatsResponse(BaseModel):
+    status: str
+    repo: str | None = None
+    message: str | None = None
+    repository: RepositoryInfo | None = None
+    contributors: List[ContributorInfo] = []
+    pull_requests: PullRequestStats | None = None
+    issues: IssueStats | None = None
+    commit_activity: List[CommitActivity] = []
+    languages: Dict[str, int] = {}
+    releases: List[ReleaseInfo] = []
+    metrics: Metrics | None = None
@@ -4,102 +4,331 @@ Fetches comprehensive stats for a GitHub repository including contributors,
 pull requests, issues, and commit activity.
 """
 import logging
-import aiohttp
+import random
+import time
 import asyncio
+import httpx
+import msgspec
+import orjson
 from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+from cachetools import TTLCache
 from app.core.config import settings
+from app.models.repo_stats import (
+    AuthorInfo,
+    CommitActivity,
+    ContributorInfo,
+    IssueDetail,
+    IssueStats,
+    Metrics,
+    PullRequestDetail,
+    PullRequestStats,
+    ReleaseInfo,
+    RepositoryInfo,
+)
 
 logger = logging.getLogger(__name__)
 
+# Wire-format structs for the list-heavy REST endpoints. msgspec decodes
+# the response bytes straight into these, which is an order of magnitude
+# faster than parsing to dicts and re-validating, and the downstream loops
+# use plain attribute access. Unknown fields are ignored on decode.
+class UserRaw(msgspec.Struct, kw_only=True):
+    login: Optional[str] = None
+    avatar_url: Optional[str] = None
+    html_url: Optional[str] = None
+
+
+class LabelRaw(msgspec.Struct, kw_only=True):
+    name: Optional[str] = None
+
+
+class ContributorRaw(msgspec.Struct, kw_only=True):
+    login: Optional[str] = None
+    avatar_url: Optional[str] = None
+    html_url: Optional[str] = None
+    contributions: int = 0
+    type: str = "User"
+
+
+class PRRaw(msgspec.Struct, kw_only=True):
+    number: Optional[int] = None
+    title: Optional[str] = None
+    state: str = "open"
+    html_url: Optional[str] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    merged_at: Optional[str] = None
+    user: Optional[UserRaw] = None
+    labels: List[LabelRaw] = []
+    comments: int = 0
+    draft: bool = False
+
+
+class IssueRaw(msgspec.Struct, kw_only=True):
+    number: Optional[int] = None
+    title: Optional[str] = None
+    state: Optional[str] = None
+    html_url: Optional[str] = None
+    created_at: Optional[str] = None
+    user: Optional[UserRaw] = None
+    labels: List[LabelRaw] = []
+    comments: int = 0
+    pull_request: Optional[Dict] = None
+
+
+class CommitWeekRaw(msgspec.Struct, kw_only=True):
+    week: int = 0
+    total: int = 0
+    days: List[int] = []
+
+
+class ReleaseRaw(msgspec.Struct, kw_only=True):
+    tag_name: Optional[str] = None
+    name: Optional[str] = None
+    published_at: Optional[str] = None
+    html_url: Optional[str] = None
+    prerelease: bool = False
+
+
+# ETag cache shared across requests: (url, params) -> (etag, parsed body).
+# A 304 revalidation transfers no body and is far cheaper on the rate limit
+# than a full response, so entries are kept for an hour.
+_etag_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+
+
+def create_github_session() -> httpx.AsyncClient:
+    """
+    Create the shared HTTP client for GitHub API calls.
+
+    Meant to be called once at application startup and stored on
+    ``app.state.http`` so that connections to api.github.com are reused
+    across requests instead of paying a TCP + TLS handshake per call.
+    GitHub supports HTTP/2, so the whole endpoint fan-out multiplexes
+    over a single connection.
+    """
+    headers = {
+        "Accept": "application/vnd.github.v3+json",
+        "User-Agent": "DevRel-AI-Bot/1.0"
+    }
+    if settings.github_token:
+        headers["Authorization"] = f"token {settings.github_token}"
+
+    return httpx.AsyncClient(
+        http2=True,
+        headers=headers,
+        timeout=httpx.Timeout(connect=10, read=30, write=10, pool=60),
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+    )
+
 
 class GitHubRepoStatsService:
     """
     Service to fetch comprehensive statistics for a GitHub repository.
+
+    The service does not own its HTTP session; callers pass in the
+    application-scoped session created by :func:`create_github_session`.
     """
 
-    def __init__(self):
+    # Per-endpoint latency budgets for the fan-out. /stats/commit_activity
+    # is computed lazily by GitHub and can take 10+ seconds on a cold repo,
+    # so it gets a tight budget and returns empty until GitHub's cache is
+    # warm; everything else answers well within the default.
+    _ENDPOINT_TIMEOUT = 15.0
+    _STATS_TIMEOUT = 3.0
+
+    # Cap concurrent GitHub calls (matches the connector's limit_per_host)
+    # so the endpoint fan-out and any retries don't stampede the API.
+    _request_semaphore = asyncio.Semaphore(10)
+
+    # Single GraphQL query covering repo info, PRs, issues, languages and
+    # releases; contributors and commit activity stay on REST (GraphQL has
+    # no contribution counts and does not expose /stats/commit_activity).
+    _GRAPHQL_QUERY = """
+    query RepoStats($owner: String!, $name: String!) {
+      repository(owner: $owner, name: $name) {
+        name
+        nameWithOwner
+        description
+        url
+        stargazerCount
+        forkCount
+        watchers { totalCount }
+        openIssues: issues(states: OPEN) { totalCount }
+        defaultBranchRef { name }
+        createdAt
+        updatedAt
+        pushedAt
+        repositoryTopics(first: 20) { nodes { topic { name } } }
+        licenseInfo { name }
+        pullRequests(first: 50, orderBy: {field: UPDATED_AT, direction: DESC}) {
+          nodes {
+            number
+            title
+            state
+            url
+            createdAt
+            updatedAt
+            isDraft
+            author { login avatarUrl url }
+            labels(first: 20) { nodes { name } }
+            comments { totalCount }
+          }
+        }
+        issues(first: 50, orderBy: {field: UPDATED_AT, direction: DESC}) {
+          nodes {
+            number
+            title
+            state
+            url
+            createdAt
+            author { login avatarUrl url }
+            labels(first: 20) { nodes { name } }
+            comments { totalCount }
+          }
+        }
+        languages(first: 20) { edges { size node { name } } }
+        releases(first: 10, orderBy: {field: CREATED_AT, direction: DESC}) {
+          nodes { tagName name publishedAt url isPrerelease }
+        }
+      }
+    }
+    """
+
+    # Epoch at which the primary rate limit resets, recorded once the
+    # remaining quota drops below a safety margin. Shared across instances.
+    _rate_limit_reset: float = 0.0
+
+    def __init__(self, session: httpx.AsyncClient):
         if not settings.github_token:
             raise ValueError("GitHub token not configured in environment variables")
 
-        self.headers = {
-            "Authorization": f"token {settings.github_token}",
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "DevRel-AI-Bot/1.0"
-        }
         self.base_url = "https://api.github.com"
-        self.session = None
-
-    async def __aenter__(self):
-        """Create async HTTP session"""
-        timeout = aiohttp.ClientTimeout(total=60, connect=10, sock_read=30)
-        connector = aiohttp.TCPConnector(limit=50, limit_per_host=10)
-        self.session = aiohttp.ClientSession(
-            headers=self.headers,
-            timeout=timeout,
-            connector=connector
-        )
-        return self
+        self.session = session
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Close async HTTP session"""
-        if self.session:
-            await self.session.close()
-
-    async def _make_request(self, url: str, params: Dict = None) -> Optional[Any]:
-        """Make a GET request to GitHub API"""
+    @classmethod
+    def _track_rate_limit(cls, headers) -> None:
+        """Record the reset time when the remaining quota is nearly gone"""
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
         try:
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    return await response.json()
-                elif response.status == 404:
-                    logger.warning(f"GitHub API 404: {url}")
-                    return None
-                elif response.status == 403:
-                    logger.error(f"GitHub API rate limit exceeded: {url}")
-                    return None
-                else:
-                    logger.error(f"GitHub API error {response.status}: {url}")
-                    return None
-        except asyncio.TimeoutError:
-            logger.error(f"Timeout accessing GitHub API: {url}")
-            return None
-        except Exception as e:
-            logger.error(f"Error making request to {url}: {str(e)}")
-            return None
+            if remaining is not None and reset is not None and int(remaining) < 5:
+                cls._rate_limit_reset = float(reset)
+        except ValueError:
+            pass
+
+    @staticmethod
+    def _retry_delay(headers, attempt: int) -> float:
+        """Backoff honoring Retry-After, else exponential with jitter"""
+        retry_after = headers.get("Retry-After")
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        return min(60, 2 ** attempt + random.random())
+
+    async def _make_request(self, url: str, params: Dict = None, type_: Any = None) -> Optional[Any]:
+        """
+        Make a GET request to GitHub API with ETag revalidation and retries.
+
+        When ``type_`` is given, the response bytes are decoded directly
+        into that msgspec type; otherwise they are parsed with orjson.
+        """
+        cache_key = (url, tuple(sorted(params.items())) if params else ())
+
+        for attempt in range(5):
+            cached = _etag_cache.get(cache_key)
+            headers = {"If-None-Match": cached[0]} if cached else None
+            delay = None
+
+            try:
+                async with self._request_semaphore:
+                    wait = type(self)._rate_limit_reset - time.time()
+                    if wait > 0:
+                        logger.warning(f"GitHub rate limit nearly exhausted, waiting {wait:.0f}s")
+                        await asyncio.sleep(min(wait, 60))
+
+                    response = await self.session.get(url, params=params, headers=headers)
+                    self._track_rate_limit(response.headers)
+                    if response.status_code == 200:
+                        # Both decoders parse the raw bytes in C, far
+                        # faster than the stdlib json of response.json()
+                        if type_ is not None:
+                            body = msgspec.json.decode(response.content, type=type_)
+                        else:
+                            body = orjson.loads(response.content)
+                        etag = response.headers.get("ETag")
+                        if etag:
+                            _etag_cache[cache_key] = (etag, body)
+                        return body
+                    elif response.status_code == 304 and cached:
+                        # Not modified: reuse the cached body and refresh its TTL
+                        _etag_cache[cache_key] = cached
+                        return cached[1]
+                    elif response.status_code == 202:
+                        # GitHub is computing the result lazily (e.g.
+                        # /stats/commit_activity); a later call will hit
+                        # its warm cache
+                        logger.info(f"GitHub API still computing (202): {url}")
+                        return None
+                    elif response.status_code == 404:
+                        logger.warning(f"GitHub API 404: {url}")
+                        return None
+                    elif response.status_code == 403:
+                        # Primary or secondary rate limit; back off and retry
+                        delay = self._retry_delay(response.headers, attempt)
+                        logger.warning(
+                            f"GitHub API rate limited (attempt {attempt + 1}/5), "
+                            f"retrying in {delay:.1f}s: {url}"
+                        )
+                    else:
+                        logger.error(f"GitHub API error {response.status_code}: {url}")
+                        return None
+            except (asyncio.TimeoutError, httpx.TimeoutException):
+                logger.error(f"Timeout accessing GitHub API: {url}")
+                return None
+            except Exception as e:
+                logger.error(f"Error making request to {url}: {str(e)}")
+                return None
+
+            # Sleep outside the semaphore so backoff doesn't hold a slot
+            await asyncio.sleep(delay)
+
+        logger.error(f"GitHub API rate limit retries exhausted: {url}")
+        return None
 
     async def get_repo_info(self, owner: str, repo: str) -> Optional[Dict]:
         """Fetch basic repository information"""
         url = f"{self.base_url}/repos/{owner}/{repo}"
         return await self._make_request(url)
 
-    async def get_contributors(self, owner: str, repo: str, max_contributors: int = 30) -> List[Dict]:
+    async def get_contributors(self, owner: str, repo: str, max_contributors: int = 30) -> List[ContributorInfo]:
         """Fetch repository contributors"""
         url = f"{self.base_url}/repos/{owner}/{repo}/contributors"
         params = {"per_page": max_contributors, "anon": "false"}
-        contributors = await self._make_request(url, params)
-        
-        if contributors and isinstance(contributors, list):
+        contributors = await self._make_request(url, params, type_=List[ContributorRaw])
+
+        if contributors and type(contributors) is list:
             return [
-                {
-                    "login": c.get("login"),
-                    "avatar_url": c.get("avatar_url"),
-                    "profile_url": c.get("html_url"),
-                    "contributions": c.get("contributions", 0),
-                    "type": c.get("type", "User")
-                }
+                ContributorInfo.model_construct(
+                    login=c.login,
+                    avatar_url=c.avatar_url,
+                    profile_url=c.html_url,
+                    contributions=c.contributions,
+                    type=c.type
+                )
                 for c in contributors
             ]
         return []
 
-    async def get_pull_requests(self, owner: str, repo: str, state: str = "all", max_prs: int = 50) -> Dict:
+    async def get_pull_requests(self, owner: str, repo: str, state: str = "all", max_prs: int = 50) -> PullRequestStats:
         """Fetch pull requests with statistics"""
         url = f"{self.base_url}/repos/{owner}/{repo}/pulls"
         params = {"state": state, "per_page": max_prs, "sort": "updated", "direction": "desc"}
-        prs = await self._make_request(url, params)
-        
-        if not prs or not isinstance(prs, list):
-            return {"open": 0, "closed": 0, "merged": 0, "total": 0, "details": []}
+        prs = await self._make_request(url, params, type_=List[PRRaw])
+
+        if not prs or type(prs) is not list:
+            return PullRequestStats()
 
         open_count = 0
         closed_count = 0
@@ -107,99 +336,112 @@ class GitHubRepoStatsService:
         details = []
 
         for pr in prs:
-            pr_state = pr.get("state", "open")
-            is_merged = pr.get("merged_at") is not None
-            
-            if pr_state == "open":
+            if pr.state == "open":
                 open_count += 1
                 display_state = "open"
-            elif is_merged:
+            elif pr.merged_at is not None:
                 merged_count += 1
                 display_state = "merged"
             else:
                 closed_count += 1
                 display_state = "closed"
 
-            details.append({
-                "number": pr.get("number"),
-                "title": pr.get("title"),
-                "state": display_state,
-                "url": pr.get("html_url"),
-                "created_at": pr.get("created_at"),
-                "updated_at": pr.get("updated_at"),
-                "author": {
-                    "login": pr.get("user", {}).get("login"),
-                    "avatar_url": pr.get("user", {}).get("avatar_url"),
-                    "profile_url": pr.get("user", {}).get("html_url")
-                },
-                "labels": [label.get("name") for label in pr.get("labels", [])],
-                "comments": pr.get("comments", 0),
-                "draft": pr.get("draft", False)
-            })
+            details.append(PullRequestDetail.model_construct(
+                number=pr.number,
+                title=pr.title,
+                state=display_state,
+                url=pr.html_url,
+                created_at=pr.created_at,
+                updated_at=pr.updated_at,
+                author=self._rest_author(pr.user),
+                labels=[label.name for label in pr.labels],
+                comments=pr.comments,
+                draft=pr.draft
+            ))
 
-        return {
-            "open": open_count,
-            "closed": closed_count,
-            "merged": merged_count,
-            "total": len(prs),
-            "details": details
-        }
+        return PullRequestStats.model_construct(
+            open=open_count,
+            closed=closed_count,
+            merged=merged_count,
+            total=open_count + closed_count + merged_count,
+            details=details
+        )
 
-    async def get_issues(self, owner: str, repo: str, state: str = "all", max_issues: int = 50) -> Dict:
+    async def get_issues(self, owner: str, repo: str, state: str = "all", max_issues: int = 50) -> IssueStats:
         """Fetch issues (excluding pull requests)"""
         url = f"{self.base_url}/repos/{owner}/{repo}/issues"
         params = {"state": state, "per_page": max_issues, "sort": "updated", "direction": "desc"}
-        issues = await self._make_request(url, params)
-        
-        if not issues or not isinstance(issues, list):
-            return {"open": 0, "closed": 0, "total": 0, "details": []}
-
-        # Filter out pull requests (they appear in issues endpoint too)
-        actual_issues = [i for i in issues if "pull_request" not in i]
-        
-        open_count = sum(1 for i in actual_issues if i.get("state") == "open")
-        closed_count = sum(1 for i in actual_issues if i.get("state") == "closed")
-        
-        details = [
-            {
-                "number": i.get("number"),
-                "title": i.get("title"),
-                "state": i.get("state"),
-                "url": i.get("html_url"),
-                "created_at": i.get("created_at"),
-                "author": {
-                    "login": i.get("user", {}).get("login"),
-                    "avatar_url": i.get("user", {}).get("avatar_url"),
-                    "profile_url": i.get("user", {}).get("html_url")
-                },
-                "labels": [label.get("name") for label in i.get("labels", [])],
-                "comments": i.get("comments", 0)
-            }
-            for i in actual_issues
-        ]
+        issues = await self._make_request(url, params, type_=List[IssueRaw])
 
-        return {
-            "open": open_count,
-            "closed": closed_count,
-            "total": len(actual_issues),
-            "details": details
-        }
+        if not issues or type(issues) is not list:
+            return IssueStats()
+
+        open_count = 0
+        closed_count = 0
+        details = []
+
+        # Single pass: skip pull requests (they appear in the issues
+        # endpoint too), count states and build details together
+        for i in issues:
+            if i.pull_request is not None:
+                continue
+
+            if i.state == "open":
+                open_count += 1
+            elif i.state == "closed":
+                closed_count += 1
+
+            details.append(IssueDetail.model_construct(
+                number=i.number,
+                title=i.title,
+                state=i.state,
+                url=i.html_url,
+                created_at=i.created_at,
+                author=self._rest_author(i.user),
+                labels=[label.name for label in i.labels],
+                comments=i.comments
+            ))
 
-    async def get_commit_activity(self, owner: str, repo: str) -> List[Dict]:
+        return IssueStats.model_construct(
+            open=open_count,
+            closed=closed_count,
+            total=len(details),
+            details=details
+        )
+
+    @staticmethod
+    def _rest_author(user: Optional[UserRaw]) -> AuthorInfo:
+        """Map a REST user struct (null for ghost users) to AuthorInfo"""
+        if user is None:
+            return AuthorInfo.model_construct(login=None, avatar_url=None, profile_url=None)
+        return AuthorInfo.model_construct(
+            login=user.login,
+            avatar_url=user.avatar_url,
+            profile_url=user.html_url
+        )
+
+    @staticmethod
+    def _format_week(timestamp: int) -> str:
+        """Format a UTC week timestamp as YYYY-MM-DD"""
+        tm = time.gmtime(timestamp)
+        return f"{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}"
+
+    async def get_commit_activity(self, owner: str, repo: str) -> List[CommitActivity]:
         """Fetch weekly commit activity for the last year"""
         url = f"{self.base_url}/repos/{owner}/{repo}/stats/commit_activity"
-        activity = await self._make_request(url)
-        
-        if activity and isinstance(activity, list):
-            # Return last 12 weeks of data
-            recent_activity = activity[-12:] if len(activity) > 12 else activity
+        activity = await self._make_request(url, type_=List[CommitWeekRaw])
+
+        if activity and type(activity) is list:
+            # Return last 12 weeks of data. GitHub's week timestamps are
+            # UTC, so format via gmtime; it is also much cheaper than
+            # fromtimestamp().strftime() and independent of the server TZ.
             return [
-                {
-                    "week": datetime.fromtimestamp(week.get("week", 0)).strftime("%Y-%m-%d"),
-                    "total": week.get("total", 0),
-                    "days": week.get("days", [0] * 7)
-                }
-                for week in recent_activity
+                CommitActivity.model_construct(
+                    week=self._format_week(week.week),
+                    total=week.total,
+                    days=week.days or [0] * 7
+                )
+                for week in activity[-12:]
             ]
         return []
 
@@ -209,42 +451,239 @@ class GitHubRepoStatsService:
         languages = await self._make_request(url)
         return languages if languages else {}
 
-    async def get_releases(self, owner: str, repo: str, max_releases: int = 10) -> List[Dict]:
+    async def get_releases(self, owner: str, repo: str, max_releases: int = 10) -> List[ReleaseInfo]:
         """Fetch repository releases"""
         url = f"{self.base_url}/repos/{owner}/{repo}/releases"
         params = {"per_page": max_releases}
-        releases = await self._make_request(url, params)
-        
-        if releases and isinstance(releases, list):
+        releases = await self._make_request(url, params, type_=List[ReleaseRaw])
+
+        if releases and type(releases) is list:
             return [
-                {
-                    "tag_name": r.get("tag_name"),
-                    "name": r.get("name"),
-                    "published_at": r.get("published_at"),
-                    "url": r.get("html_url"),
-                    "prerelease": r.get("prerelease", False)
-                }
+                ReleaseInfo.model_construct(
+                    tag_name=r.tag_name,
+                    name=r.name,
+                    published_at=r.published_at,
+                    url=r.html_url,
+                    prerelease=r.prerelease
+                )
                 for r in releases
             ]
         return []
 
+    async def _graphql_request(self, variables: Dict) -> Optional[Dict]:
+        """POST the stats query to the GraphQL endpoint"""
+        url = f"{self.base_url}/graphql"
+        try:
+            async with self._request_semaphore:
+                response = await self.session.post(
+                    url,
+                    content=orjson.dumps({"query": self._GRAPHQL_QUERY, "variables": variables}),
+                    headers={"Content-Type": "application/json"}
+                )
+                if response.status_code != 200:
+                    logger.warning(f"GitHub GraphQL HTTP {response.status_code}, falling back to REST")
+                    return None
+                return orjson.loads(response.content)
+        except Exception as e:
+            logger.warning(f"GitHub GraphQL request failed, falling back to REST: {e}")
+            return None
+
+    @staticmethod
+    def _graphql_author(author: Optional[Dict]) -> AuthorInfo:
+        """Map a GraphQL actor (may be null for ghost users) to AuthorInfo"""
+        author = author or {}
+        return AuthorInfo.model_construct(
+            login=author.get("login"),
+            avatar_url=author.get("avatarUrl"),
+            profile_url=author.get("url")
+        )
+
+    async def get_comprehensive_stats_graphql(self, owner: str, repo: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch comprehensive stats with a single GraphQL query plus two REST
+        calls (contributors and commit activity), instead of the seven-way
+        REST fan-out. Returns None when GraphQL is unavailable (e.g. token
+        without GraphQL scope) so the caller can fall back to REST.
+        """
+        payload, contributors, commit_activity = await asyncio.gather(
+            self._graphql_request({"owner": owner, "name": repo}),
+            asyncio.wait_for(self.get_contributors(owner, repo), timeout=self._ENDPOINT_TIMEOUT),
+            asyncio.wait_for(self.get_commit_activity(owner, repo), timeout=self._STATS_TIMEOUT),
+            return_exceptions=True
+        )
+
+        if isinstance(payload, Exception) or not payload:
+            return None
+        if isinstance(contributors, Exception):
+            logger.error(f"Error fetching contributors: {contributors}")
+            contributors = []
+        if isinstance(commit_activity, Exception):
+            logger.error(f"Error fetching commit activity: {commit_activity}")
+            commit_activity = []
+
+        node = (payload.get("data") or {}).get("repository")
+        if not node:
+            errors = payload.get("errors", [])
+            if any(e.get("type") == "NOT_FOUND" for e in errors):
+                raise ValueError(f"Repository {owner}/{repo} not found")
+            logger.warning(f"GitHub GraphQL errors, falling back to REST: {errors}")
+            return None
+
+        open_count = closed_count = merged_count = 0
+        pr_details = []
+        pr_nodes = node["pullRequests"]["nodes"]
+        for pr in pr_nodes:
+            state = pr.get("state", "OPEN").lower()
+            if state == "open":
+                open_count += 1
+            elif state == "merged":
+                merged_count += 1
+            else:
+                closed_count += 1
+            pr_details.append(PullRequestDetail.model_construct(
+                number=pr.get("number"),
+                title=pr.get("title"),
+                state=state,
+                url=pr.get("url"),
+                created_at=pr.get("createdAt"),
+                updated_at=pr.get("updatedAt"),
+                author=self._graphql_author(pr.get("author")),
+                labels=[label.get("name") for label in pr.get("labels", {}).get("nodes", [])],
+                comments=pr.get("comments", {}).get("totalCount", 0),
+                draft=pr.get("isDraft", False)
+            ))
+        pull_requests = PullRequestStats.model_construct(
+            open=open_count,
+            closed=closed_count,
+            merged=merged_count,
+            total=len(pr_nodes),
+            details=pr_details
+        )
+
+        issue_open = issue_closed = 0
+        issue_details = []
+        issue_nodes = node["issues"]["nodes"]
+        for i in issue_nodes:
+            state = i.get("state", "OPEN").lower()
+            if state == "open":
+                issue_open += 1
+            else:
+                issue_closed += 1
+            issue_details.append(IssueDetail.model_construct(
+                number=i.get("number"),
+                title=i.get("title"),
+                state=state,
+                url=i.get("url"),
+                created_at=i.get("createdAt"),
+                author=self._graphql_author(i.get("author")),
+                labels=[label.get("name") for label in i.get("labels", {}).get("nodes", [])],
+                comments=i.get("comments", {}).get("totalCount", 0)
+            ))
+        issues = IssueStats.model_construct(
+            open=issue_open,
+            closed=issue_closed,
+            total=len(issue_nodes),
+            details=issue_details
+        )
+
+        languages = {
+            edge["node"]["name"]: edge.get("size", 0)
+            for edge in node.get("languages", {}).get("edges", [])
+        }
+        releases = [
+            ReleaseInfo.model_construct(
+                tag_name=r.get("tagName"),
+                name=r.get("name"),
+                published_at=r.get("publishedAt"),
+                url=r.get("url"),
+                prerelease=r.get("isPrerelease", False)
+            )
+            for r in node.get("releases", {}).get("nodes", [])
+        ]
+
+        total_commits = sum(week.total for week in commit_activity) if commit_activity else 0
+
+        return {
+            "status": "success",
+            "repo": f"{owner}/{repo}",
+            "repository": RepositoryInfo.model_construct(
+                name=node.get("name"),
+                full_name=node.get("nameWithOwner"),
+                description=node.get("description"),
+                url=node.get("url"),
+                stars=node.get("stargazerCount", 0),
+                forks=node.get("forkCount", 0),
+                watchers=node.get("watchers", {}).get("totalCount", 0),
+                open_issues_count=node.get("openIssues", {}).get("totalCount", 0),
+                default_branch=(node.get("defaultBranchRef") or {}).get("name"),
+                created_at=node.get("createdAt"),
+                updated_at=node.get("updatedAt"),
+                pushed_at=node.get("pushedAt"),
+                topics=[t["topic"]["name"] for t in node.get("repositoryTopics", {}).get("nodes", [])],
+                license=(node.get("licenseInfo") or {}).get("name")
+            ),
+            "contributors": contributors,
+            "pull_requests": pull_requests,
+            "issues": issues,
+            "commit_activity": commit_activity,
+            "languages": languages,
+            "releases": releases,
+            "metrics": Metrics.model_construct(
+                total_contributors=len(contributors),
+                total_commits_recent=total_commits,
+                stars=node.get("stargazerCount", 0),
+                forks=node.get("forkCount", 0),
+                open_prs=pull_requests.open,
+                open_issues=issues.open
+            )
+        }
+
     async def get_comprehensive_stats(self, owner: str, repo: str) -> Dict[str, Any]:
         """
         Fetch comprehensive repository statistics.
         Returns all data needed for the dashboard.
+
+        Prefers the single-request GraphQL path and falls back to the
+        seven-way REST fan-out when GraphQL is unavailable.
         """
         logger.info(f"Fetching comprehensive stats for {owner}/{repo}")
-        
+
+        result = await self.get_comprehensive_stats_graphql(owner, repo)
+        if result is not None:
+            return result
+
+        return await self._get_comprehensive_stats_rest(owner, repo)
+
+    async def _repo_exists(self, owner: str, repo: str) -> bool:
+        """Probe the repo with a HEAD request before fanning out"""
+        try:
+            response = await self.session.head(f"{self.base_url}/repos/{owner}/{repo}")
+            return response.status_code != 404
+        except Exception as e:
+            # Probe failures shouldn't block the analysis; let the
+            # fan-out surface any real errors
+            logger.warning(f"Repo existence check failed for {owner}/{repo}: {e}")
+            return True
+
+    async def _get_comprehensive_stats_rest(self, owner: str, repo: str) -> Dict[str, Any]:
+        """Fetch comprehensive stats via the REST endpoint fan-out"""
         try:
-            # Fetch all data concurrently
+            # One cheap HEAD before spending seven rate-limit tokens on a
+            # repo that doesn't exist
+            if not await self._repo_exists(owner, repo):
+                raise ValueError(f"Repository {owner}/{repo} not found")
+
+            # Fetch all data concurrently, each with its own latency budget
+            # so one slow endpoint degrades to its empty default instead of
+            # delaying the whole response
             repo_info, contributors, pull_requests, issues, commit_activity, languages, releases = await asyncio.gather(
-                self.get_repo_info(owner, repo),
-                self.get_contributors(owner, repo),
-                self.get_pull_requests(owner, repo),
-                self.get_issues(owner, repo),
-                self.get_commit_activity(owner, repo),
-                self.get_languages(owner, repo),
-                self.get_releases(owner, repo),
+                asyncio.wait_for(self.get_repo_info(owner, repo), timeout=self._ENDPOINT_TIMEOUT),
+                asyncio.wait_for(self.get_contributors(owner, repo), timeout=self._ENDPOINT_TIMEOUT),
+                asyncio.wait_for(self.get_pull_requests(owner, repo), timeout=self._ENDPOINT_TIMEOUT),
+                asyncio.wait_for(self.get_issues(owner, repo), timeout=self._ENDPOINT_TIMEOUT),
+                asyncio.wait_for(self.get_commit_activity(owner, repo), timeout=self._STATS_TIMEOUT),
+                asyncio.wait_for(self.get_languages(owner, repo), timeout=self._ENDPOINT_TIMEOUT),
+                asyncio.wait_for(self.get_releases(owner, repo), timeout=self._ENDPOINT_TIMEOUT),
                 return_exceptions=True
             )
 
@@ -257,10 +696,10 @@ class GitHubRepoStatsService:
                 contributors = []
             if isinstance(pull_requests, Exception):
                 logger.error(f"Error fetching pull requests: {pull_requests}")
-                pull_requests = {"open": 0, "closed": 0, "merged": 0, "total": 0, "details": []}
+                pull_requests = PullRequestStats()
             if isinstance(issues, Exception):
                 logger.error(f"Error fetching issues: {issues}")
-                issues = {"open": 0, "closed": 0, "total": 0, "details": []}
+                issues = IssueStats()
             if isinstance(commit_activity, Exception):
                 logger.error(f"Error fetching commit activity: {commit_activity}")
                 commit_activity = []
@@ -275,41 +714,41 @@ class GitHubRepoStatsService:
                 raise ValueError(f"Repository {owner}/{repo} not found")
 
             # Calculate additional metrics
-            total_commits = sum(week.get("total", 0) for week in commit_activity) if commit_activity else 0
-            
+            total_commits = sum(week.total for week in commit_activity) if commit_activity else 0
+
             return {
                 "status": "success",
                 "repo": f"{owner}/{repo}",
-                "repository": {
-                    "name": repo_info.get("name"),
-                    "full_name": repo_info.get("full_name"),
-                    "description": repo_info.get("description"),
-                    "url": repo_info.get("html_url"),
-                    "stars": repo_info.get("stargazers_count", 0),
-                    "forks": repo_info.get("forks_count", 0),
-                    "watchers": repo_info.get("watchers_count", 0),
-                    "open_issues_count": repo_info.get("open_issues_count", 0),
-                    "default_branch": repo_info.get("default_branch"),
-                    "created_at": repo_info.get("created_at"),
-                    "updated_at": repo_info.get("updated_at"),
-                    "pushed_at": repo_info.get("pushed_at"),
-                    "topics": repo_info.get("topics", []),
-                    "license": repo_info.get("license", {}).get("name") if repo_info.get("license") else None
-                },
+                "repository": RepositoryInfo.model_construct(
+                    name=repo_info.get("name"),
+                    full_name=repo_info.get("full_name"),
+                    description=repo_info.get("description"),
+                    url=repo_info.get("html_url"),
+                    stars=repo_info.get("stargazers_count", 0),
+                    forks=repo_info.get("forks_count", 0),
+                    watchers=repo_info.get("watchers_count", 0),
+                    open_issues_count=repo_info.get("open_issues_count", 0),
+                    default_branch=repo_info.get("default_branch"),
+                    created_at=repo_info.get("created_at"),
+                    updated_at=repo_info.get("updated_at"),
+                    pushed_at=repo_info.get("pushed_at"),
+                    topics=repo_info.get("topics", []),
+                    license=repo_info.get("license", {}).get("name") if repo_info.get("license") else None
+                ),
                 "contributors": contributors,
                 "pull_requests": pull_requests,
                 "issues": issues,
                 "commit_activity": commit_activity,
                 "languages": languages,
                 "releases": releases,
-                "metrics": {
-                    "total_contributors": len(contributors),
-                    "total_commits_recent": total_commits,
-                    "stars": repo_info.get("stargazers_count", 0),
-                    "forks": repo_info.get("forks_count", 0),
-                    "open_prs": pull_requests.get("open", 0),
-                    "open_issues": issues.get("open", 0)
-                }
+                "metrics": Metrics.model_construct(
+                    total_contributors=len(contributors),
+                    total_commits_recent=total_commits,
+                    stars=repo_info.get("stargazers_count", 0),
+                    forks=repo_info.get("forks_count", 0),
+                    open_prs=pull_requests.open,
+                    open_issues=issues.open
+                )
             }
 
         except Exception as e:
@@ -12,6 +12,7 @@ from app.core.config import settings
 from app.core.orchestration.agent_coordinator import AgentCoordinator
 from app.core.orchestration.queue_manager import AsyncQueueManager
 from app.database.weaviate.client import get_weaviate_client
+from app.services.github.repo_stats import create_github_session
 from integrations.discord.bot import DiscordBot
 from discord.ext import commands
 # DevRel commands are now loaded dynamically (commented out below)
@@ -97,9 +98,11 @@ async def lifespan(app: FastAPI):
     Lifespan manager for the FastAPI application. Handles startup and shutdown events.
     """
     app.state.app_instance = app_instance
+    app.state.http = create_github_session()
     await app_instance.start_background_tasks()
     yield
     await app_instance.stop_background_tasks()
+    await app.state.http.aclose()
 
 
 api = FastAPI(title="Devr.AI API", version="1.0", lifespan=lifespan)